@@ -0,0 +1,187 @@
+"""
+Optional Numba-compiled simulation kernel.
+
+Runs a whole batch of parsed operations on int arrays without going through
+the interpreter for each step. The board's occupancy grid is shared with the
+kernel (no copy), ship states are packed into arrays before the batch and
+written back to the Ship objects after it.
+
+Numba is not a required dependency: when it is missing NUMBA_AVAILABLE is False
+and callers should stick to the pure-Python Board methods.
+"""
+
+from .game import _EMPTY, _L, _M, _R, Board, BoardError
+from .models import _DX, _DY, OperationType, Orientation, Position, Ship
+from .parser import ParsedOperation
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Optional speed-up, see module docstring
+    np = None
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+# Below this many operations the one-off JIT compilation costs more than it saves
+KERNEL_MIN_OPERATIONS = 10_000
+
+# Operation opcodes
+_OP_MOVE = 0
+_OP_SHOOT = 1
+
+# Per-operation outcomes reported by the kernel
+_STATUS_OK = 0
+_STATUS_NO_SHIP = 1
+_STATUS_OUT_OF_BOUNDS = 2
+_STATUS_COLLISION = 3
+
+
+def _run_simulation(size, grid, ships, sunk, ops, sequences, status, details):
+    """
+    Mirrors Board.apply_move_sequence / Board.apply_shoot for every row of ops.
+
+    grid:      intc[size * size], ship index per cell (_EMPTY = no ship)
+    ships:     int64[n_ships, 3], (x, y, orientation int) per ship index
+    sunk:      uint8[n_ships]
+    ops:       int64[n_ops, 5], (opcode, x, y, sequence start, sequence end)
+    sequences: uint8[], every move sequence concatenated
+    status:    int64[n_ops], outcome per operation (output)
+    details:   int64[n_ops, 5], data needed to rebuild the error (output):
+               (x, y, step) of the failing step when out of bounds,
+               (x, y, ship index, orientation, sunk) of the ship collided with
+    """
+    for i in range(ops.shape[0]):
+        x = ops[i, 1]
+        y = ops[i, 2]
+        ship = _EMPTY
+        if 0 <= x < size and 0 <= y < size:
+            ship = grid[y * size + x]
+
+        if ops[i, 0] == _OP_SHOOT:
+            if ship >= 0:
+                sunk[ship] = 1
+            continue
+
+        if ship < 0:
+            status[i] = _STATUS_NO_SHIP
+            continue
+        if sunk[ship]:
+            continue
+
+        nx = x
+        ny = y
+        o = ships[ship, 2]
+        out_of_bounds = False
+        for k in range(ops[i, 3], ops[i, 4]):
+            command = sequences[k]
+            if command == _M:
+                nx += _DX[o]
+                ny += _DY[o]
+                if not (0 <= nx < size and 0 <= ny < size):
+                    status[i] = _STATUS_OUT_OF_BOUNDS
+                    details[i, 0] = nx
+                    details[i, 1] = ny
+                    details[i, 2] = k - ops[i, 3] + 1
+                    out_of_bounds = True
+                    break
+            elif command == _L:
+                o = (o + 3) & 3
+            elif command == _R:
+                o = (o + 1) & 3
+        if out_of_bounds:
+            continue
+
+        original_cell = y * size + x
+        final_cell = ny * size + nx
+        if final_cell != original_cell:
+            colliding = grid[final_cell]
+            if colliding >= 0:
+                status[i] = _STATUS_COLLISION
+                details[i, 0] = nx
+                details[i, 1] = ny
+                details[i, 2] = colliding
+                details[i, 3] = ships[colliding, 2]
+                details[i, 4] = sunk[colliding]
+                continue
+            grid[final_cell] = ship
+            grid[original_cell] = _EMPTY
+        ships[ship, 0] = nx
+        ships[ship, 1] = ny
+        ships[ship, 2] = o
+
+
+if NUMBA_AVAILABLE:
+    _run_simulation = njit(cache=True)(_run_simulation)
+
+
+def apply_operations(
+    board: Board, operations: list[ParsedOperation]
+) -> list[tuple[int, BoardError]]:
+    """
+    Applies a batch of operations to the board with the compiled kernel.
+    Operations that fail do not stop the batch, like in main.py: they are
+    returned as (index in the batch, error) pairs with the same error messages
+    the Board methods would have raised. Board logging is bypassed.
+    """
+    size = board.size
+    ship_list = board._initial_ships_order
+
+    ships = np.array(
+        [(s.position.x, s.position.y, int(s.orientation)) for s in ship_list],
+        dtype=np.int64,
+    ).reshape(len(ship_list), 3)
+    sunk = np.array([s.sunk for s in ship_list], dtype=np.uint8)
+
+    # Coordinates are clamped so any out-of-bounds value stays out of bounds
+    # while still fitting in an int64
+    rows: list[tuple[int, int, int, int, int]] = []
+    sequences: list[bytes] = []
+    offset = 0
+    for op in operations:
+        x = min(max(op[1].x, -1), size)
+        y = min(max(op[1].y, -1), size)
+        if op[0] is OperationType.MOVE:
+            sequence = bytes(op[2])
+            sequences.append(sequence)
+            rows.append((_OP_MOVE, x, y, offset, offset + len(sequence)))
+            offset += len(sequence)
+        else:
+            rows.append((_OP_SHOOT, x, y, 0, 0))
+    ops = np.array(rows, dtype=np.int64).reshape(len(rows), 5)
+
+    status = np.zeros(len(operations), dtype=np.int64)
+    details = np.zeros((len(operations), 5), dtype=np.int64)
+    _run_simulation(
+        size,
+        np.frombuffer(board._grid, dtype=np.intc),
+        ships,
+        sunk,
+        ops,
+        np.frombuffer(b"".join(sequences), dtype=np.uint8),
+        status,
+        details,
+    )
+
+    for ship, (x, y, o), is_sunk in zip(ship_list, ships.tolist(), sunk.tolist()):
+        ship.position = Position(x, y)
+        ship.orientation = Orientation(o)
+        ship.sunk = bool(is_sunk)
+
+    errors: list[tuple[int, BoardError]] = []
+    for i in np.flatnonzero(status).tolist():
+        outcome = status[i]
+        nx, ny, step_or_idx, orientation, was_sunk = details[i].tolist()
+        if outcome == _STATUS_NO_SHIP:
+            msg = f"No ship found at starting position {operations[i][1]} for move sequence."
+        elif outcome == _STATUS_OUT_OF_BOUNDS:
+            msg = f"Target {Position(nx, ny)} out of bounds (Board: {size}x{size}) on step {step_or_idx}."
+        else:
+            # The colliding ship as it was when the collision happened
+            final_position = Position(nx, ny)
+            colliding_ship = Ship(
+                final_position, Orientation(orientation), bool(was_sunk)
+            )
+            msg = f"Collision at {final_position} with {colliding_ship}!"
+        errors.append((i, BoardError(msg)))
+    return errors
@@ -1,10 +1,35 @@
 import logging
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 
-from .models import MoveCommand, Position, Ship
+from .models import (
+    _DX,
+    _DY,
+    _ROT_L,
+    _ROT_R,
+    MoveCommand,
+    MoveSequence,
+    Orientation,
+    Position,
+    Ship,
+    format_move_sequence,
+)
 
 logger = logging.getLogger(__name__)
 
+# Plain int command codes, cheaper to compare against than enum members
+_L = int(MoveCommand.L)
+_R = int(MoveCommand.R)
+_M = int(MoveCommand.M)
+_M_BYTE = bytes([_M])
+
+# Occupancy grid value of a cell without any ship
+_EMPTY = -1
+
+# Orientation after a net number of right turns (mod 4), indexed by the
+# orientation before it
+_ROTATIONS = (tuple(Orientation), _ROT_R, tuple(_ROT_R[o] for o in _ROT_R), _ROT_L)
+
 
 class BoardError(Exception):
     """Custom exception for board-related errors."""
@@ -12,177 +37,231 @@ class BoardError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Board:
     """Represents the game board and manages ship states."""
 
     size: int
+    # Flat occupancy grid indexed by y * size + x, holding the index of the ship
+    # in _initial_ships_order (_EMPTY when there is none)
+    _grid: array = field(init=False, repr=False, compare=False)
+    # Keep a separate list to maintain the original order for final output
+    _initial_ships_order: list[Ship] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.size <= 0:
             raise ValueError("Board size must be positive.")
-        # Store ships mapped by their current position for quick lookup
-        # Note: We store the actual Ship objects
-        self._ships: dict[Position, Ship] = {}
-        # Keep a separate list to maintain the original order for final output
-        self._initial_ships_order: list[Ship] = []
+        self._grid = array("i", [_EMPTY]) * (self.size * self.size)
+        self._initial_ships_order = []
 
     def is_within_bounds(self, position: Position) -> bool:
         """Checks if a position is within the board boundaries."""
-        return 0 <= position.x < self.size and 0 <= position.y < self.size
+        size = self.size
+        return 0 <= position.x < size and 0 <= position.y < size
 
     def add_ship(self, ship: Ship) -> None:
         """Adds a ship to the board at its initial position."""
-        logger.debug(f"Attempting to place ship {ship}...")
+        logger.debug("Attempting to place ship %s...", ship)
         if not self.is_within_bounds(ship.position):
             msg = f"Position {ship.position} is out of bounds (Board Size: {self.size}x{self.size})."
-            logger.error(f"❌ Failed to add ship {ship}: {msg}")
+            logger.error("❌ Failed to add ship %s: %s", ship, msg)
             raise BoardError(msg)
-        if ship.position in self._ships:
-            msg = f"Position {ship.position} is already occupied by {self._ships[ship.position]}."
-            logger.error(f"❌ Failed to add ship {ship}: {msg}")
+        cell = ship.position.y * self.size + ship.position.x
+        if (occupant_idx := self._grid[cell]) >= 0:
+            msg = f"Position {ship.position} is already occupied by {self._initial_ships_order[occupant_idx]}."
+            logger.error("❌ Failed to add ship %s: %s", ship, msg)
             raise BoardError(msg)
 
-        logger.info(f"➕ Placed ship {ship} at {ship.position}")
-        self._ships[ship.position] = ship
+        logger.info("➕ Placed ship %s at %s", ship, ship.position)
+        self._grid[cell] = len(self._initial_ships_order)
         self._initial_ships_order.append(ship)
 
+    def _locate(self, position: Position) -> tuple[int, int]:
+        """
+        Returns the grid cell of the position and the index of the ship on it
+        (_EMPTY if there is none, including for out-of-bounds positions).
+        """
+        x, y, size = position.x, position.y, self.size
+        cell = y * size + x
+        if not (0 <= x < size and 0 <= y < size):
+            return cell, _EMPTY
+        return cell, self._grid[cell]
+
     def get_ship_at(self, position: Position) -> Ship | None:
         """Returns the ship at the given position, or None if empty."""
-        return self._ships.get(position)
+        ship_idx = self._locate(position)[1]
+        return None if ship_idx < 0 else self._initial_ships_order[ship_idx]
 
     def _simulate_move(
-        self, start_ship_state: Ship, sequence: list[MoveCommand]
-    ) -> Ship:
+        self, start_ship_state: Ship, sequence: MoveSequence
+    ) -> tuple[int, int, Orientation]:
         """
         Simulates a move sequence step-by-step, checking boundaries.
-        Returns the calculated final ship state without modifying the board.
+        Returns the final (x, y, orientation) without modifying the board.
         Raises BoardError if move goes out of bounds, ValueError for invalid chars.
         """
-        # Work on a copy to avoid side effects during simulation
-        current_ship_state = Ship(
-            start_ship_state.position, start_ship_state.orientation
-        )
-        logger.debug(
-            f"➡️ Simulating move: Start={start_ship_state}, Sequence={sequence}"
-        )
-
-        for i, command in enumerate(sequence):
-            action_taken = "Unknown"
-            match command:
-                case MoveCommand.L:
-                    current_ship_state.rotate_left()
-                    action_taken = "Rotated Left"
-                case MoveCommand.R:
-                    current_ship_state.rotate_right()
-                    action_taken = "Rotated Right"
-                case MoveCommand.M:
-                    potential_next_pos = current_ship_state.position.move(
-                        current_ship_state.orientation
-                    )
-                    if not self.is_within_bounds(potential_next_pos):
-                        msg = f"Target {potential_next_pos} out of bounds (Board: {self.size}x{self.size}) on step {i+1}."
-                        logger.warning(f"⚠️ Boundary breach during simulation: {msg}")
-                        raise BoardError(msg)
-                    current_ship_state.move_forward()
-                    action_taken = "Moved Forward"
+        # Work on plain coordinates rather than Ship/Position copies: the caller
+        # only materializes a Position if the ship actually ends up moving
+        x = start_ship_state.position.x
+        y = start_ship_state.position.y
+        o = start_ship_state.orientation
+        size = self.size
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
             logger.debug(
-                f"   Sim Step {i+1} ({command.name}): {action_taken} -> {current_ship_state}"
+                "➡️ Simulating move: Start=%s, Sequence=%s",
+                start_ship_state,
+                format_move_sequence(sequence),
             )
 
-        logger.debug(f"🏁 Simulation Result: {current_ship_state}")
-        return current_ship_state
+        # Only the net effect of the rotations between two moves matters, so
+        # each run of L/R is folded into a single turn (R=+1, L=-1, mod 4)
+        *turn_runs, trailing_turns = bytes(sequence).split(_M_BYTE)
+        step = 0
+        for turns in turn_runs:
+            step += len(turns) + 1
+            o = _ROTATIONS[(turns.count(_R) - turns.count(_L)) & 3][o]
+            nx = x + _DX[o]
+            ny = y + _DY[o]
+            if not (0 <= nx < size and 0 <= ny < size):
+                msg = f"Target {Position(nx, ny)} out of bounds (Board: {size}x{size}) on step {step}."
+                logger.warning("⚠️ Boundary breach during simulation: %s", msg)
+                raise BoardError(msg)
+            x = nx
+            y = ny
+            if debug:
+                logger.debug(
+                    "   Sim Step %d (M): Moved Forward -> (%d, %d, %s)",
+                    step,
+                    x,
+                    y,
+                    o.name,
+                )
+        o = _ROTATIONS[(trailing_turns.count(_R) - trailing_turns.count(_L)) & 3][o]
 
-    def apply_move_sequence(
-        self, start_pos: Position, sequence: list[MoveCommand]
-    ) -> None:
+        if debug:
+            logger.debug("🏁 Simulation Result: %s", Ship(Position(x, y), o))
+        return x, y, o
+
+    def apply_move_sequence(self, start_pos: Position, sequence: MoveSequence) -> None:
         """Applies a sequence of movements to the ship at start_pos."""
-        logger.info(f"➡️ Attempting move: Start={start_pos}, Sequence={sequence}")
-        if not (ship_to_move := self.get_ship_at(start_pos)):
-            logger.warning(f"❌ Move failed: No ship found at {start_pos}!")
+        # Look the ship up first: missing and sunk ships exit before any work.
+        # The start cell is kept for the grid update at the end.
+        original_cell, ship_idx = self._locate(start_pos)
+        ship_to_move = None if ship_idx < 0 else self._initial_ships_order[ship_idx]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "➡️ Attempting move: Start=%s, Sequence=%s",
+                start_pos,
+                format_move_sequence(sequence),
+            )
+        if ship_to_move is None:
+            logger.warning("❌ Move failed: No ship found at %s!", start_pos)
             raise BoardError(
                 f"No ship found at starting position {start_pos} for move sequence."
             )
 
         # Requirement isn't explicit, but let's assume sunk ships cannot move
         if ship_to_move.sunk:
-            logger.warning(f"🟡 Move ignored: Ship at {start_pos} is already sunk.")
+            logger.warning("🟡 Move ignored: Ship at %s is already sunk.", start_pos)
             return
 
         original_position = ship_to_move.position
-        original_ship_state_str = str(ship_to_move)  # Capture state before simulation
 
         try:
-            final_simulated_state = self._simulate_move(ship_to_move, sequence)
+            final_x, final_y, final_orientation = self._simulate_move(
+                ship_to_move, sequence
+            )
         except BoardError as e:
             logger.warning(
-                f"❌ Move sequence {sequence} failed for {original_ship_state_str}: {e}"
+                "❌ Move sequence %s failed for %s: %s",
+                format_move_sequence(sequence),
+                ship_to_move,
+                e,
             )
             raise  # Re-raise the specific error (e.g., out of bounds)
         except ValueError as e:  # Should not happen with Enum but capture just in case
             logger.error(
-                f"💥 Unexpected error in move sequence {sequence} for {original_ship_state_str}: {e}"
+                "💥 Unexpected error in move sequence %s for %s: %s",
+                format_move_sequence(sequence),
+                ship_to_move,
+                e,
             )
             raise e
 
-        final_position = final_simulated_state.position
-        final_orientation = final_simulated_state.orientation
-
-        colliding_ship = self._ships.get(final_position)
-        if (
-            final_position != original_position
-            and colliding_ship
-            and colliding_ship is not ship_to_move
-        ):
+        grid = self._grid
+        final_cell = final_y * self.size + final_x
+        # A ship can only collide with another ship when it actually changes cell
+        moved = final_cell != original_cell
+        final_position = Position(final_x, final_y) if moved else original_position
+        if moved and (colliding_idx := grid[final_cell]) >= 0:
+            colliding_ship = self._initial_ships_order[colliding_idx]
             msg = f"Collision at {final_position} with {colliding_ship}!"
             logger.warning(
-                f"❌ Move sequence {sequence} failed for {original_ship_state_str}: {msg}"
+                "❌ Move sequence %s failed for %s: %s",
+                format_move_sequence(sequence),
+                ship_to_move,
+                msg,
             )
             raise BoardError(msg)
 
-        # Commit the move if simulation and checks passed
-        final_state_str = (
-            f"({final_position.x}, {final_position.y}, {final_orientation.name})"
-        )
-        logger.info(
-            f"✅ Move committed: {original_ship_state_str} -> {final_state_str}"
-        )
-        ship_to_move.position = final_position
+        # Commit the move if simulation and checks passed. The ship is only
+        # updated after logging, so it still renders its original state here.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "✅ Move committed: %s -> %s",
+                ship_to_move,
+                Ship(final_position, final_orientation),
+            )
         ship_to_move.orientation = final_orientation
 
-        if final_position != original_position:
+        # Ships that end where they started (e.g. rotations only) leave both
+        # their position and the grid untouched
+        if not moved:
             logger.debug(
-                f"   🗺️ Map update: Removing from {original_position}, adding at {final_position}."
+                "   🗺️ Map update: No change needed (ship ended at %s).",
+                original_position,
             )
-            if self._ships.get(original_position) is ship_to_move:
-                del self._ships[original_position]
-            self._ships[final_position] = ship_to_move
             return
 
         logger.debug(
-            f"   🗺️ Map update: No change needed (ship ended at {original_position})."
+            "   🗺️ Map update: Removing from %s, adding at %s.",
+            original_position,
+            final_position,
         )
+        ship_to_move.position = final_position
+        grid[final_cell] = ship_idx
+        grid[original_cell] = _EMPTY
 
     def apply_shoot(self, target_pos: Position) -> None:
         """Applies a shoot operation at the target position."""
-        logger.info(f"💥 Applying shoot: Target={target_pos}")
+        info = logger.isEnabledFor(logging.INFO)
+        if info:
+            logger.info("💥 Applying shoot: Target=%s", target_pos)
+        x, y, size = target_pos.x, target_pos.y, self.size
         # Requirement isn't explicit, but let's assume out-of-bounds shots are ignored
-        if not self.is_within_bounds(target_pos):
-            logger.warning(f"⚠️ Shoot ignored: Target {target_pos} is out of bounds.")
+        if not (0 <= x < size and 0 <= y < size):
+            logger.warning("⚠️ Shoot ignored: Target %s is out of bounds.", target_pos)
             return
 
-        if not (ship_hit := self.get_ship_at(target_pos)):
-            logger.info(f"   ⚪ Shoot at {target_pos}: Miss.")
+        if (ship_idx := self._grid[y * size + x]) < 0:
+            if info:
+                logger.info("   ⚪ Shoot at %s: Miss.", target_pos)
             return
 
-        if not ship_hit.sunk:
-            logger.info(f"   🎯 Shoot at {target_pos}: Hit! Sinking {ship_hit}.")
-            ship_hit.sink()
+        ship_hit = self._initial_ships_order[ship_idx]
+        if ship_hit.sunk:
+            if info:
+                logger.info(
+                    "   🟡 Shoot at %s: Hit, but %s was already sunk.",
+                    target_pos,
+                    ship_hit,
+                )
             return
 
-        logger.info(
-            f"   🟡 Shoot at {target_pos}: Hit, but {ship_hit} was already sunk."
-        )
+        if info:
+            logger.info("   🎯 Shoot at %s: Hit! Sinking %s.", target_pos, ship_hit)
+        ship_hit.sunk = True
 
     def get_final_ship_states(self) -> list[str]:
         """Returns the final state of all ships as strings, preserving initial order."""
@@ -1,48 +1,36 @@
-from dataclasses import dataclass
-from enum import Enum, auto
+from dataclasses import FrozenInstanceError, dataclass
+from enum import Enum, IntEnum, auto
+from typing import ClassVar
 
 
-class Orientation(Enum):
-    N = auto()
-    E = auto()
-    S = auto()
-    W = auto()
+class Orientation(IntEnum):
+    """Numbered clockwise, so the values index the lookup tables below."""
+
+    N = 0
+    E = 1
+    S = 2
+    W = 3
 
     def rotate_left(self) -> "Orientation":
         """Rotates the orientation 90 degrees counter-clockwise."""
-        match self:
-            case Orientation.N:
-                return Orientation.W
-            case Orientation.W:
-                return Orientation.S
-            case Orientation.S:
-                return Orientation.E
-            case Orientation.E:
-                return Orientation.N
+        return _ROT_L[self]
 
     def rotate_right(self) -> "Orientation":
         """Rotates the orientation 90 degrees clockwise."""
-        match self:
-            case Orientation.N:
-                return Orientation.E
-            case Orientation.E:
-                return Orientation.S
-            case Orientation.S:
-                return Orientation.W
-            case Orientation.W:
-                return Orientation.N
+        return _ROT_R[self]
 
     def to_vector(self) -> tuple[int, int]:
         """Returns the change in (x, y) for moving one step in this orientation."""
-        match self:
-            case Orientation.N:
-                return (0, 1)
-            case Orientation.E:
-                return (1, 0)
-            case Orientation.S:
-                return (0, -1)
-            case Orientation.W:
-                return (-1, 0)
+        return _DX[self], _DY[self]
+
+
+# Lookup tables indexed by orientation value
+_ROT_L = (Orientation.W, Orientation.N, Orientation.E, Orientation.S)
+_ROT_R = (Orientation.E, Orientation.S, Orientation.W, Orientation.N)
+_DX = (0, 1, 0, -1)
+_DY = (1, 0, -1, 0)
+# Plain tuple lookup, cheaper than the Enum .name descriptor
+_NAMES = tuple(orientation.name for orientation in Orientation)
 
 
 class OperationType(Enum):
@@ -50,28 +38,86 @@ class OperationType(Enum):
     SHOOT = auto()
 
 
-class MoveCommand(Enum):
-    L = auto()
-    R = auto()
-    M = auto()
+class MoveCommand(IntEnum):
+    """Single step of a move sequence. Int-valued so sequences pack into bytes."""
+
+    L = 0
+    R = 1
+    M = 2
+
+
+# A parsed move sequence: one MoveCommand value per step
+MoveSequence = bytes | list[MoveCommand]
+
+
+def format_move_sequence(sequence: MoveSequence) -> str:
+    """Renders a move sequence back to its "LRM..." string form."""
+    return "".join(MoveCommand(command).name for command in sequence)
 
 
-@dataclass(frozen=True)
 class Position:
     """
-    Represents a position on the board. Frozen for immutability and hashability.
+    Represents a position on the board. Immutable and hashable.
+    Small int coordinates are interned: they always give back the same object,
+    so moving around the board does not keep allocating (and hashing) positions.
+    Anything else (large, negative or non-int) gets a fresh, uncached instance,
+    which keeps the cache bounded however many coordinates are read.
     """
 
+    __slots__ = ("x", "y", "_hash")
+    # Coordinates in [0, _INTERN_LIMIT) are interned, so at most
+    # _INTERN_LIMIT ** 2 positions are ever cached
+    _INTERN_LIMIT: ClassVar[int] = 128
+    _cache: ClassVar[dict[tuple[int, int], "Position"]] = {}
+
     x: int
     y: int
 
+    def __new__(cls, x: int, y: int) -> "Position":
+        key = (x, y)
+        # Exact ints only: Position(1.0, 2.0) must not alias Position(1, 2)
+        exact_ints = type(x) is int and type(y) is int
+        if exact_ints and (position := cls._cache.get(key)) is not None:
+            return position
+
+        position = super().__new__(cls)
+        object.__setattr__(position, "x", x)
+        object.__setattr__(position, "y", y)
+        object.__setattr__(position, "_hash", hash(key))
+        limit = cls._INTERN_LIMIT
+        if exact_ints and 0 <= x < limit and 0 <= y < limit:
+            cls._cache[key] = position
+        return position
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self) -> tuple[type["Position"], tuple[int, int]]:
+        return Position, (self.x, self.y)
+
+    def __eq__(self, other: object) -> bool:
+        # Interning makes identity the common case
+        if self is other:
+            return True
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Position(x={self.x!r}, y={self.y!r})"
+
     def move(self, orientation: Orientation) -> "Position":
         """Calculates the new position after moving one step in the given orientation."""
-        dx, dy = orientation.to_vector()
-        return Position(self.x + dx, self.y + dy)
+        return Position(self.x + _DX[orientation], self.y + _DY[orientation])
 
 
-@dataclass
+@dataclass(slots=True)
 class Ship:
     position: Position
     orientation: Orientation
@@ -94,10 +140,9 @@ class Ship:
         self.sunk = True
 
     def __str__(self) -> str:
-        status = " SUNK" if self.sunk else ""
-        return (
-            f"({self.position.x}, {self.position.y}, {self.orientation.name}){status}"
-        )
+        position = self.position
+        state = f"({position.x}, {position.y}, {_NAMES[self.orientation]})"
+        return state + " SUNK" if self.sunk else state
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Ship):
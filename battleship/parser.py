@@ -1,7 +1,14 @@
 import re
-from typing import TextIO
-
-from .models import MoveCommand, OperationType, Orientation, Position, Ship
+from typing import Iterator, TextIO
+
+from .models import (
+    MoveCommand,
+    MoveSequence,
+    OperationType,
+    Orientation,
+    Position,
+    Ship,
+)
 
 
 class ParseError(ValueError):
@@ -13,10 +20,30 @@ class ParseError(ValueError):
 # Regex patterns
 # Matches "(x, y, O)" allowing for whitespace and ensuring orientation is N, E, S, or W
 SHIP_REGEX = re.compile(r"\(\s*(\d+)\s*,\s*(\d+)\s*,\s*([NESWnesw])\s*\)")
-# Matches "(x, y)" allowing for whitespace
-COORD_REGEX = re.compile(r"\(\s*(\d+)\s*,\s*(\d+)\s*\)")
-# Matches "(x, y) LRM..." allowing for whitespace and ensuring moves are L, R, or M
-MOVE_REGEX = re.compile(r"\(\s*(\d+)\s*,\s*(\d+)\s*\)\s*([LRMlrm]+)")
+# Matches "(x, y)" or "(x, y) LRM..." allowing for whitespace and ensuring moves
+# are L, R, or M. An empty move group means the operation is a shoot.
+OPERATION_REGEX = re.compile(r"\(\s*(\d+)\s*,\s*(\d+)\s*\)\s*([LRMlrm]*)")
+# Matches a whole "(x, y)" or "(x, y) LRM..." line inside a multi-line buffer.
+# [^\S\n] is any whitespace except a line break, so a match never spans lines.
+OPERATION_LINE_REGEX = re.compile(
+    r"^[^\S\n]*\([^\S\n]*(\d+)[^\S\n]*,[^\S\n]*(\d+)[^\S\n]*\)[^\S\n]*([LRMlrm]*)[^\S\n]*$",
+    re.MULTILINE,
+)
+# Operations are streamed from the input file in blocks of this many characters
+_READ_CHUNK_SIZE = 1 << 16
+
+# Orientation for each letter accepted by SHIP_REGEX, in either case
+_ORIENTATIONS = {
+    **{orientation.name: orientation for orientation in Orientation},
+    **{orientation.name.lower(): orientation for orientation in Orientation},
+}
+# Deletes valid move commands (any case), leaving only invalid characters
+_DELETE_MOVE_CHARS = str.maketrans("", "", "LRMlrm")
+# Translates an "LRM..." sequence (any case) into its MoveCommand values
+_MOVE_SEQUENCE_TABLE = bytes.maketrans(
+    b"LRMlrm",
+    bytes([MoveCommand.L, MoveCommand.R, MoveCommand.M] * 2),
+)
 
 
 def parse_board_size(line: str) -> int:
@@ -41,7 +68,6 @@ def parse_initial_ships(line: str) -> list[Ship]:
     if not (line := line.strip()):
         return ships
 
-    processed_line_len = 0
     last_match_end = 0
     for match in SHIP_REGEX.finditer(line):
         # Check for unexpected characters between matches
@@ -53,13 +79,10 @@ def parse_initial_ships(line: str) -> list[Ship]:
 
         x, y, orient_char = match.groups()
         try:
-            orientation = Orientation[orient_char.upper()]
+            orientation = _ORIENTATIONS[orient_char]
             pos = Position(int(x), int(y))
             ships.append(Ship(position=pos, orientation=orientation))
             last_match_end = match.end()
-            processed_line_len += len(
-                match.group(0).replace(" ", "")
-            )  # Count non-whitespace chars in match
         except (ValueError, KeyError) as e:
             # Shouldn't happen if regex matches, but good practice 🤓
             raise ParseError(f"Invalid ship format within '{match.group(0)}'") from e
@@ -73,22 +96,22 @@ def parse_initial_ships(line: str) -> list[Ship]:
 
 
 ParsedOperation = (
-    tuple[OperationType, Position] | tuple[OperationType, Position, list[MoveCommand]]
+    tuple[OperationType, Position] | tuple[OperationType, Position, MoveSequence]
 )
 
 
-def parse_move_sequence(sequence_str: str) -> list[MoveCommand]:
-    """Parses a move sequence string into a list of MoveCommand."""
-    commands: list[MoveCommand] = []
-    for char in sequence_str.upper():
-        try:
-            commands.append(MoveCommand[char])
-        except KeyError as e:
-            # This should ideally be caught by MOVE_REGEX, but defensive check 🤓
-            raise ParseError(
-                f"Invalid character '{char}' in move sequence '{sequence_str}'"
-            ) from e
-    return commands
+def parse_move_sequence(sequence_str: str) -> bytes:
+    """
+    Parses a move sequence string into bytes, one MoveCommand value per step.
+    The simulation then iterates plain small ints instead of Enum members.
+    """
+    # Validated and converted case-insensitively, without an upper-cased copy
+    if invalid_chars := sequence_str.translate(_DELETE_MOVE_CHARS):
+        # This should ideally be caught by OPERATION_REGEX, but defensive check 🤓
+        raise ParseError(
+            f"Invalid character '{invalid_chars.upper()[0]}' in move sequence '{sequence_str}'"
+        )
+    return sequence_str.encode("ascii").translate(_MOVE_SEQUENCE_TABLE)
 
 
 def parse_operation(line: str) -> ParsedOperation:
@@ -100,58 +123,104 @@ def parse_operation(line: str) -> ParsedOperation:
     if not line or not (line := line.strip()):
         raise ParseError("Operation line is empty.")
 
-    if move_match := MOVE_REGEX.fullmatch(line):
-        # Move operation 🏃
-        x, y, sequence_str = move_match.groups()
-        try:
-            return (
-                OperationType.MOVE,
-                Position(int(x), int(y)),
-                parse_move_sequence(sequence_str),
-            )
-        except (ValueError, ParseError) as e:
-            # Catch potential errors from Position or sequence parsing
-            raise ParseError(f"Invalid move operation format '{line}': {e}") from e
-
-    if shoot_match := COORD_REGEX.fullmatch(line):
+    if operation_match := OPERATION_REGEX.fullmatch(line):
+        x, y, sequence_str = operation_match.groups()
+        if sequence_str:
+            # Move operation 🏃
+            try:
+                return (
+                    OperationType.MOVE,
+                    Position(int(x), int(y)),
+                    parse_move_sequence(sequence_str),
+                )
+            except (ValueError, ParseError) as e:
+                # Catch potential errors from Position or sequence parsing
+                raise ParseError(f"Invalid move operation format '{line}': {e}") from e
+
         # Shoot operation 🔫
-        x, y = shoot_match.groups()
         try:
             return OperationType.SHOOT, Position(int(x), int(y))
         except ValueError:
             # If int conversion fails
             raise ParseError(f"Invalid coordinate numbers in shoot operation: '{line}'")
 
-    # If neither MOVE nor SHOOT pattern matched fully
+    # If the line is neither a MOVE nor a SHOOT operation
     raise ParseError(
         f"Invalid operation format: '{line}'. Expected '(x, y)' or '(x, y) LRM...'."
     )
 
 
-def parse_input_file(file: TextIO) -> tuple[int, list[Ship], list[ParsedOperation]]:
-    """Parses the entire input file stream."""
+def _iter_operation_lines(
+    data: str, first_line_number: int
+) -> Iterator[ParsedOperation]:
+    """Parses operation lines one by one, reporting errors with their line number."""
+    for i, line in enumerate(data.split("\n"), start=first_line_number):
+        if not (stripped_line := line.strip()):
+            continue
+        try:
+            # parse_operation now guaranteed to return ParsedOperation or raise
+            yield parse_operation(stripped_line)
+        except ParseError as e:
+            raise ParseError(f"Error on line {i}: {e}") from e
+        except ValueError as e:
+            # Catch potential errors from Position int conversion if regex somehow fails
+            raise ParseError(
+                f"Error on line {i}: Invalid number format in operation '{line}'. {e}"
+            ) from e
+
+
+def _iter_block_operations(
+    data: str, first_line_number: int
+) -> Iterator[ParsedOperation]:
+    """
+    Parses a block of operation lines with a single regex scan.
+    Falls back to line-by-line parsing from the first line the scan cannot
+    handle, so invalid input still gets the precise error and line number.
+    """
+    last_match_end = 0
+    for match in OPERATION_LINE_REGEX.finditer(data):
+        if data[last_match_end : match.start()].strip():
+            break  # Something other than blank lines between two operations
+
+        x, y, sequence_str = match.groups()
+        try:
+            position = Position(int(x), int(y))
+        except ValueError:
+            break  # E.g. too many digits, reported by the line-by-line parser
+        if sequence_str:
+            # Move operation 🏃 (the regex already validated the characters)
+            sequence = sequence_str.encode("ascii").translate(_MOVE_SEQUENCE_TABLE)
+            yield OperationType.MOVE, position, sequence
+        else:
+            # Shoot operation 🔫
+            yield OperationType.SHOOT, position
+        last_match_end = match.end()
+
+    if data[last_match_end:].strip():
+        line_number = first_line_number + data.count("\n", 0, last_match_end)
+        yield from _iter_operation_lines(data[last_match_end:], line_number)
+
+
+def parse_header(file: TextIO) -> tuple[int, list[Ship]]:
+    """
+    Parses the board size and initial ships (the first two lines) of the input
+    file stream, leaving the stream positioned at the first operation line.
+    """
 
-    if not (lines := list(file)):
+    if not (size_line := file.readline()):
         raise ParseError("Input file is empty.")
 
     # Line 1: Board Size
     try:
-        size = parse_board_size(lines[0])
+        size = parse_board_size(size_line)
     except ParseError as e:
         raise ParseError(f"Error on line 1 (Board Size): {e}") from e
 
-    if len(lines) < 2:
+    if not (initial_ships_line := file.readline()):
         # Allow simulations with no operations, but size and ships are required.
-        initial_ships_line = ""
-        operation_lines = []
-        if lines:  # Check if there's at least a size line
-            raise ParseError(
-                "Input file must contain at least board size and initial ships line."
-            )
-            # If only size is given, still raise error as ship line is mandatory.
-    else:
-        initial_ships_line = lines[1]
-        operation_lines = lines[2:]
+        raise ParseError(
+            "Input file must contain at least board size and initial ships line."
+        )
 
     # Line 2: Initial Ships
     try:
@@ -159,21 +228,35 @@ def parse_input_file(file: TextIO) -> tuple[int, list[Ship], list[ParsedOperatio
     except ParseError as e:
         raise ParseError(f"Error on line 2 (Initial Ships): {e}") from e
 
-    # Subsequent Lines: Operations
-    operations: list[ParsedOperation] = []
-    for i, line in enumerate(operation_lines, start=3):
-        if not (stripped_line := line.strip()):
+    return size, initial_ships
+
+
+def iter_operations(file: TextIO) -> Iterator[ParsedOperation]:
+    """
+    Lazily parses the operation lines of an input file stream positioned after
+    its header (see parse_header). The stream is read in fixed-size blocks of
+    whole lines, so memory stays constant however many operations there are.
+    """
+    line_number = 3
+    pending: list[str] = []  # Start of a line not terminated yet
+    while chunk := file.read(_READ_CHUNK_SIZE):
+        if (last_newline := chunk.rfind("\n")) < 0:
+            pending.append(chunk)
             continue
-        try:
-            # parse_operation now guaranteed to return ParsedOperation or raise
-            op = parse_operation(stripped_line)
-            operations.append(op)
-        except ParseError as e:
-            raise ParseError(f"Error on line {i}: {e}") from e
-        except ValueError as e:
-            # Catch potential errors from Position int conversion if regex somehow fails
-            raise ParseError(
-                f"Error on line {i}: Invalid number format in operation '{line}'. {e}"
-            ) from e
+        pending.append(chunk[:last_newline])
+        block = "".join(pending)
+        yield from _iter_block_operations(block, line_number)
+        line_number += block.count("\n") + 1
+        pending = [chunk[last_newline + 1 :]]
+
+    if last_line := "".join(pending):
+        yield from _iter_block_operations(last_line, line_number)
+
 
-    return size, initial_ships, operations
+def parse_input_file(file: TextIO) -> tuple[int, list[Ship], list[ParsedOperation]]:
+    """
+    Parses the entire input file stream. Since every operation is kept anyway,
+    the operation lines are read and scanned in one go rather than in blocks.
+    """
+    size, initial_ships = parse_header(file)
+    return size, initial_ships, list(_iter_block_operations(file.read(), 3))
@@ -1,31 +1,51 @@
 import argparse
 import logging
+import os
 import sys
+from itertools import islice
 from pathlib import Path
+from typing import Callable, Iterable, TextIO
 
 from battleship.game import Board, BoardError
-from battleship.models import OperationType, Ship
-from battleship.parser import ParsedOperation, ParseError, parse_input_file
+from battleship.models import OperationType, Ship, format_move_sequence
+from battleship.parser import (
+    ParsedOperation,
+    ParseError,
+    iter_operations,
+    parse_header,
+)
 
+# Per-step tracing is expensive on long inputs, so it is opt-in, e.g.
+# BATTLESHIP_LOG_LEVEL=DEBUG python main.py input.txt output.txt
+log_level = os.environ.get("BATTLESHIP_LOG_LEVEL", "WARNING").upper()
+valid_log_level = log_level in logging.getLevelNamesMapping()
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=log_level if valid_log_level else logging.WARNING,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[logging.StreamHandler(sys.stdout)],
 )
 logger = logging.getLogger(__name__)
+if not valid_log_level:
+    logger.warning(f"Unknown BATTLESHIP_LOG_LEVEL '{log_level}', using WARNING.")
 
 
-def _load_simulation_setup(
-    filepath: Path,
-) -> tuple[int, list[Ship], list[ParsedOperation]]:
-    """Loads and parses the simulation setup from the input file."""
+def _open_input_file(filepath: Path) -> TextIO:
+    """Opens the input file for reading."""
     logger.info(f"Reading simulation setup from: {filepath}")
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return parse_input_file(f)
+        return open(filepath, "r", encoding="utf-8")
     except FileNotFoundError:
         logger.error(f"Input file not found at '{filepath}'")
         raise
+
+
+def _load_simulation_setup(file: TextIO, filepath: Path) -> tuple[int, list[Ship]]:
+    """
+    Parses the board size and initial ships from the input file. Operations are
+    parsed lazily afterwards, while they are applied.
+    """
+    try:
+        return parse_header(file)
     except ParseError as e:
         logger.error(f"Error parsing input file '{filepath}':\n{e}")
         raise
@@ -39,34 +59,94 @@ def _write_simulation_results(filepath: Path, final_states: list[str]) -> None:
     logger.info(f"Writing {len(final_states)} final ship state(s) to: {filepath}")
     try:
         with open(filepath, "w", encoding="utf-8") as f:
-            for state in final_states:
-                f.write(state + "\n")
+            # One newline-terminated line per ship, written in a single call
+            if final_states:
+                f.write("\n".join(final_states) + "\n")
         logger.info("Output written successfully.")
     except IOError as e:
         logger.exception(f"Failed to write output file '{filepath}'")
         raise RuntimeError(f"Failed to write output file '{filepath}'") from e
 
 
-def _execute_operation(board: Board, operation: ParsedOperation, op_index: int) -> None:
-    """Executes a single parsed operation on the board."""
-    op_type = operation[0]
-    try:
-        if op_type is OperationType.MOVE:
-            assert len(operation) == 3, "Move operation tuple should have 3 elements"
-            _, start_pos, sequence = operation
-            board.apply_move_sequence(start_pos, sequence)
-        elif op_type is OperationType.SHOOT:
-            assert len(operation) == 2, "Shoot operation tuple should have 2 elements"
-            _, target_pos = operation
-            board.apply_shoot(target_pos)
-        else:
+def _build_dispatch(
+    board: Board,
+) -> dict[OperationType, Callable[..., None]]:
+    """
+    Maps each operation type to the board method applying it. The method takes
+    the rest of the parsed operation tuple as its arguments.
+    """
+    return {
+        OperationType.MOVE: board.apply_move_sequence,
+        OperationType.SHOOT: board.apply_shoot,
+    }
+
+
+def _describe_operation(op: ParsedOperation) -> str:
+    """Renders a parsed operation for logs, with its moves as "LRM..." text."""
+    if op[0] is OperationType.MOVE:
+        return repr((op[0], op[1], format_move_sequence(op[2])))
+    return repr(op)
+
+
+def _kernel_enabled() -> bool:
+    """Whether operations may be run through the optional Numba kernel."""
+    # The kernel bypasses Board logging, including the warnings about ignored or
+    # failed operations, so it only runs when those would not be shown anyway
+    if logging.getLogger("battleship").isEnabledFor(logging.WARNING):
+        return False
+    # Imported lazily, loading Numba alone takes longer than small inputs do
+    from battleship._kernels import NUMBA_AVAILABLE
+
+    return NUMBA_AVAILABLE
+
+
+def _apply_operations_in_python(
+    board: Board, operations: Iterable[ParsedOperation], first_index: int
+) -> int:
+    """Applies operations one by one through the board, returning how many ran."""
+    dispatch = _build_dispatch(board)
+    i = first_index - 1
+    for i, op in enumerate(operations, start=first_index):
+        if (apply_operation := dispatch.get(op[0])) is None:
             # Should not happen if parser is correct, but defensive check
-            logger.error(
-                f"Unknown operation type '{op_type}' encountered at index {op_index}."
+            logger.error(f"Unknown operation type '{op[0]}' encountered at index {i}.")
+            continue
+        try:
+            apply_operation(*op[1:])
+        except (BoardError, ValueError) as e:
+            # Log operation errors as warnings and continue simulation
+            logger.warning(
+                f"Error during operation {i} ({_describe_operation(op)}): {e}"
+            )
+    return i - first_index + 1
+
+
+def _apply_operations(board: Board, operations: Iterable[ParsedOperation]) -> int:
+    """
+    Applies the operations in order as they are parsed, logging the ones that
+    fail, and returns how many were applied. With the kernel enabled they are
+    consumed in batches: full batches go through the kernel, the final partial
+    one (too small to be worth it) through the board itself.
+    """
+    if not _kernel_enabled():
+        return _apply_operations_in_python(board, operations, first_index=1)
+
+    from battleship._kernels import KERNEL_MIN_OPERATIONS
+    from battleship._kernels import apply_operations as apply_operations_in_kernel
+
+    applied = 0
+    operations = iter(operations)
+    while batch := list(islice(operations, KERNEL_MIN_OPERATIONS)):
+        if len(batch) < KERNEL_MIN_OPERATIONS:
+            applied += _apply_operations_in_python(board, batch, applied + 1)
+            break
+        for i, e in apply_operations_in_kernel(board, batch):
+            logger.warning(
+                f"Error during operation {applied + i + 1} "
+                f"({_describe_operation(batch[i])}): {e}"
             )
-    except (BoardError, ValueError) as e:
-        # Log operation errors as warnings and continue simulation
-        logger.warning(f"Error during operation {op_index} ({operation}): {e}")
+        applied += len(batch)
+    return applied
 
 
 def main():
@@ -88,25 +168,35 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        # Load setup
-        size, initial_ships, operations = _load_simulation_setup(input_filepath)
-
-        # Initialize board
-        logger.info(f"Initializing board of size {size}x{size}.")
-        board = Board(size)
-
-        # Add initial ships (keep error handling here as it's critical setup)
-        logger.info(f"Placing {len(initial_ships)} initial ship(s)...")
-        for ship in initial_ships:
+        with _open_input_file(input_filepath) as input_file:
+            # Load setup
+            size, initial_ships = _load_simulation_setup(input_file, input_filepath)
+
+            # Initialize board
+            logger.info(f"Initializing board of size {size}x{size}.")
+            board = Board(size)
+
+            # Add initial ships (keep error handling here as it's critical setup)
+            logger.info(f"Placing {len(initial_ships)} initial ship(s)...")
+            for ship in initial_ships:
+                try:
+                    board.add_ship(ship)
+                except BoardError as e:
+                    logger.error(
+                        f"Critical Error: Failed adding initial ship {ship}: {e}"
+                    )
+                    sys.exit(1)  # Exit on critical initial setup error
+
+            # Operations are streamed from the file as they are applied, so a
+            # parse error only surfaces once the lines before it have run. No
+            # output is written in that case, like for any other parse error.
+            logger.info("Applying operations...")
             try:
-                board.add_ship(ship)
-            except BoardError as e:
-                logger.error(f"Critical Error: Failed adding initial ship {ship}: {e}")
-                sys.exit(1)  # Exit on critical initial setup error
-
-        logger.info(f"Applying {len(operations)} operation(s)...")
-        for i, op in enumerate(operations, start=1):
-            _execute_operation(board, op, i)
+                applied = _apply_operations(board, iter_operations(input_file))
+            except ParseError as e:
+                logger.error(f"Error parsing input file '{input_filepath}':\n{e}")
+                raise
+            logger.info(f"Applied {applied} operation(s).")
 
         _write_simulation_results(output_filepath, board.get_final_ship_states())
 
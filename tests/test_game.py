@@ -7,10 +7,17 @@ from battleship.models import MoveCommand, Orientation, Position, Ship
 def test_board_init_valid():
     board = Board(10)
     assert board.size == 10
-    assert board._ships == {}
+    assert len(board._grid) == 100
+    assert all(cell == -1 for cell in board._grid)
     assert board._initial_ships_order == []
 
 
+def test_board_is_slotted():
+    board = Board(3)
+    assert not hasattr(board, "__dict__")
+    assert repr(board) == "Board(size=3)"
+
+
 def test_board_init_invalid_size():
     with pytest.raises(ValueError, match="Board size must be positive"):
         Board(0)
@@ -48,6 +55,16 @@ def test_board_add_ship_valid():
     assert board._initial_ships_order == [ship1, ship2]
 
 
+def test_board_get_ship_at_out_of_bounds():
+    board = Board(5)
+    board.add_ship(Ship(Position(0, 0), Orientation.N))
+    board.add_ship(Ship(Position(4, 4), Orientation.N))
+    # Must not wrap around onto another cell of the flat grid
+    assert board.get_ship_at(Position(-1, 1)) is None
+    assert board.get_ship_at(Position(5, 3)) is None
+    assert board.get_ship_at(Position(0, 5)) is None
+
+
 def test_board_add_ship_out_of_bounds():
     board = Board(5)
     ship = Ship(Position(5, 0), Orientation.N)
@@ -117,21 +134,63 @@ def test_board_apply_move_sequence_simple():
     assert board.get_ship_at(Position(2, 3)) is ship  # Ship is at new position
 
 
+def test_board_apply_move_sequence_accepts_bytes_and_lists():
+    sequence = [MoveCommand.M, MoveCommand.R, MoveCommand.M, MoveCommand.L]
+    final_states = []
+    for form in (sequence, bytes(sequence)):
+        board = Board(10)
+        board.add_ship(Ship(Position(1, 2), Orientation.N))
+        board.apply_move_sequence(Position(1, 2), form)
+        final_states.append(board.get_final_ship_states())
+
+    assert final_states == [["(2, 3, N)"], ["(2, 3, N)"]]
+
+
 def test_board_apply_move_sequence_rotate_only():
     board = Board(10)
     ship = Ship(Position(5, 5), Orientation.W)
     board.add_ship(ship)
     start_pos = Position(5, 5)
 
+    grid_before = board._grid.tobytes()
+
     # Sequence: LRLR
     sequence = [MoveCommand.L, MoveCommand.R, MoveCommand.L, MoveCommand.R]
     board.apply_move_sequence(start_pos, sequence)
 
+    assert board._grid.tobytes() == grid_before  # Grid untouched
     assert ship.position == Position(5, 5)  # Position unchanged
     assert ship.orientation == Orientation.W
     assert board.get_ship_at(start_pos) is ship  # Still at original position
 
 
+def test_board_apply_move_sequence_long_rotation_runs():
+    board = Board(10)
+    ship = Ship(Position(5, 5), Orientation.N)
+    board.add_ship(ship)
+
+    # 5 rights (net: E), move, 7 lefts (net: S), move, 6 rights (net: N)
+    L, R, M = MoveCommand.L, MoveCommand.R, MoveCommand.M
+    sequence = [R] * 5 + [M] + [L] * 7 + [M] + [R] * 6
+    board.apply_move_sequence(Position(5, 5), sequence)
+
+    assert ship.position == Position(6, 4)
+    assert ship.orientation == Orientation.N
+    assert board.get_ship_at(Position(6, 4)) is ship
+
+
+def test_board_apply_move_sequence_move_off_board_after_rotations():
+    board = Board(5)
+    ship = Ship(Position(4, 4), Orientation.N)
+    board.add_ship(ship)
+
+    # Rotations still count as steps in the error message
+    sequence = [MoveCommand.L] * 5 + [MoveCommand.R, MoveCommand.M]
+    with pytest.raises(BoardError, match=r"out of bounds \(Board: 5x5\) on step 7\."):
+        board.apply_move_sequence(Position(4, 4), sequence)
+    assert ship.orientation == Orientation.N
+
+
 def test_board_apply_move_sequence_move_off_board():
     board = Board(5)  # 0-4
     ship = Ship(Position(4, 4), Orientation.N)
@@ -205,6 +264,22 @@ def test_board_apply_move_sequence_moves_through_occupied_cell():
         board.apply_move_sequence(start_pos, sequence)
 
 
+def test_board_apply_move_sequence_out_of_bounds_before_collision():
+    board = Board(3)
+    ship1 = Ship(Position(1, 0), Orientation.N)
+    ship2 = Ship(Position(1, 1), Orientation.E)  # Crossed on the way out
+    board.add_ship(ship1)
+    board.add_ship(ship2)
+
+    # Bounds are checked on every move, occupancy only once the sequence is done
+    sequence = [MoveCommand.M, MoveCommand.M, MoveCommand.M]
+    with pytest.raises(BoardError, match=r"Target Position\(x=1, y=3\) out of bounds"):
+        board.apply_move_sequence(Position(1, 0), sequence)
+
+    assert board.get_ship_at(Position(1, 0)) is ship1
+    assert board.get_ship_at(Position(1, 1)) is ship2
+
+
 def test_board_apply_move_sequence_no_ship_at_start():
     board = Board(10)
     sequence = [MoveCommand.M]
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+pytest.importorskip("numba")
+
+from battleship._kernels import apply_operations
+from battleship.game import Board, BoardError
+from battleship.models import MoveCommand, OperationType, Orientation, Position, Ship
+from battleship.parser import ParsedOperation
+
+
+def _make_board(size: int, ships: list[tuple[int, int, Orientation]]) -> Board:
+    board = Board(size)
+    for x, y, orientation in ships:
+        board.add_ship(Ship(Position(x, y), orientation))
+    return board
+
+
+def _apply_in_python(
+    board: Board, operations: list[ParsedOperation]
+) -> list[tuple[int, str]]:
+    errors = []
+    for i, op in enumerate(operations):
+        try:
+            if op[0] is OperationType.MOVE:
+                board.apply_move_sequence(op[1], op[2])
+            else:
+                board.apply_shoot(op[1])
+        except BoardError as e:
+            errors.append((i, str(e)))
+    return errors
+
+
+def test_apply_operations_simple():
+    board = _make_board(10, [(0, 0, Orientation.N), (9, 2, Orientation.E)])
+    sequence = bytes([MoveCommand.M, MoveCommand.R, MoveCommand.M])
+    errors = apply_operations(
+        board,
+        [
+            (OperationType.MOVE, Position(0, 0), sequence),
+            (OperationType.SHOOT, Position(9, 2)),
+            (OperationType.MOVE, Position(9, 2), bytes([MoveCommand.M])),  # Sunk
+            (OperationType.MOVE, Position(5, 5), bytes([MoveCommand.M])),
+            (OperationType.MOVE, Position(1, 1), bytes([MoveCommand.R] * 3)),
+        ],
+    )
+
+    assert board.get_final_ship_states() == ["(1, 1, N)", "(9, 2, E) SUNK"]
+    assert board.get_ship_at(Position(1, 1)) is board._initial_ships_order[0]
+    assert board.get_ship_at(Position(0, 0)) is None
+    assert [(i, str(e)) for i, e in errors] == [
+        (3, "No ship found at starting position Position(x=5, y=5) for move sequence.")
+    ]
+
+
+def test_apply_operations_matches_python_path():
+    rng = random.Random(42)
+    size = 4
+    cells = rng.sample([(x, y) for x in range(size) for y in range(size)], 10)
+    ships = [(x, y, rng.choice(list(Orientation))) for x, y in cells]
+    operations: list[ParsedOperation] = []
+    for _ in range(2000):
+        position = Position(rng.randrange(-1, size + 1), rng.randrange(-1, size + 1))
+        if rng.random() < 0.1:
+            operations.append((OperationType.SHOOT, position))
+        else:
+            # Mostly start from a ship so that moves actually happen
+            if rng.random() < 0.8:
+                position = Position(*rng.choice(cells))
+            sequence = bytes(rng.choice(list(MoveCommand)) for _ in range(4))
+            operations.append((OperationType.MOVE, position, sequence))
+
+    python_board = _make_board(size, ships)
+    kernel_board = _make_board(size, ships)
+    python_errors = _apply_in_python(python_board, operations)
+    kernel_errors = apply_operations(kernel_board, operations)
+
+    assert kernel_board.get_final_ship_states() == python_board.get_final_ship_states()
+    assert kernel_board._grid == python_board._grid
+    assert [(i, str(e)) for i, e in kernel_errors] == python_errors
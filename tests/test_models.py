@@ -1,3 +1,8 @@
+import copy
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from battleship.models import Orientation, Position, Ship
 
 
@@ -15,6 +20,12 @@ def test_orientation_rotate_right():
     assert Orientation.W.rotate_right() == Orientation.N
 
 
+def test_orientation_rotations_return_members():
+    for orientation in Orientation:
+        assert orientation.rotate_left() is Orientation((orientation - 1) % 4)
+        assert orientation.rotate_right() is Orientation((orientation + 1) % 4)
+
+
 def test_orientation_to_vector():
     assert Orientation.N.to_vector() == (0, 1)
     assert Orientation.E.to_vector() == (1, 0)
@@ -30,6 +41,37 @@ def test_position_move():
     assert pos.move(Orientation.W) == Position(0, 1)
 
 
+def test_position_interned_and_immutable():
+    pos = Position(2, 3)
+    assert Position(2, 3) is pos
+    assert Position(x=2, y=3) is pos
+    assert Position(1, 1).move(Orientation.E) is Position(2, 1)
+    assert copy.deepcopy(pos) is pos
+    assert {pos: "a"}[Position(2, 3)] == "a"
+    with pytest.raises(FrozenInstanceError):
+        pos.x = 5  # type: ignore[misc]
+
+
+def test_position_cache_stays_bounded():
+    limit = Position._INTERN_LIMIT
+    for i in range(10_000):
+        Position(limit + i, i)
+        Position(-i - 1, 0)
+    assert len(Position._cache) <= limit * limit
+    assert (limit, 0) not in Position._cache
+    # Out-of-range positions are still equal and hash alike, just not shared
+    assert Position(limit, 0) == Position(limit, 0)
+    assert hash(Position(limit, 0)) == hash(Position(limit, 0))
+
+
+def test_position_cache_only_interns_ints():
+    float_pos = Position(1.0, 2.0)
+    int_pos = Position(1, 2)
+    assert type(int_pos.x) is int and type(int_pos.y) is int
+    assert float_pos is not int_pos
+    assert float_pos == int_pos
+
+
 def test_ship_rotate_left():
     ship = Ship(Position(0, 0), Orientation.N)
     ship.rotate_left()
@@ -76,6 +118,13 @@ def test_ship_sink():
     assert ship.sunk
 
 
+def test_ship_is_slotted():
+    ship = Ship(Position(0, 0), Orientation.N)
+    assert not hasattr(ship, "__dict__")
+    with pytest.raises(AttributeError):
+        ship.speed = 3  # type: ignore[attr-defined]
+
+
 def test_ship_str_representation():
     ship = Ship(Position(1, 3), Orientation.N)
     assert str(ship) == "(1, 3, N)"
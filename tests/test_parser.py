@@ -3,9 +3,12 @@ import io
 import pytest
 
 from battleship.models import MoveCommand, OperationType, Orientation, Position, Ship
+from battleship import parser
 from battleship.parser import (
     ParseError,
+    iter_operations,
     parse_board_size,
+    parse_header,
     parse_initial_ships,
     parse_input_file,
     parse_move_sequence,
@@ -92,19 +95,21 @@ def test_parse_operation_move_valid():
     assert parse_operation("(0, 0) MRMLMM") == (
         OperationType.MOVE,
         Position(0, 0),
-        [
-            MoveCommand.M,
-            MoveCommand.R,
-            MoveCommand.M,
-            MoveCommand.L,
-            MoveCommand.M,
-            MoveCommand.M,
-        ],
+        bytes(
+            [
+                MoveCommand.M,
+                MoveCommand.R,
+                MoveCommand.M,
+                MoveCommand.L,
+                MoveCommand.M,
+                MoveCommand.M,
+            ]
+        ),
     )
     assert parse_operation(" ( 3, 4 ) LmR \n") == (
         OperationType.MOVE,
         Position(3, 4),
-        [MoveCommand.L, MoveCommand.M, MoveCommand.R],
+        bytes([MoveCommand.L, MoveCommand.M, MoveCommand.R]),
     )
 
 
@@ -145,14 +150,16 @@ def test_parse_input_file_valid_example():
     assert operations[0] == (
         OperationType.MOVE,
         Position(0, 0),
-        [
-            MoveCommand.M,
-            MoveCommand.R,
-            MoveCommand.M,
-            MoveCommand.L,
-            MoveCommand.M,
-            MoveCommand.M,
-        ],
+        bytes(
+            [
+                MoveCommand.M,
+                MoveCommand.R,
+                MoveCommand.M,
+                MoveCommand.L,
+                MoveCommand.M,
+                MoveCommand.M,
+            ]
+        ),
     )
     assert operations[1] == (OperationType.SHOOT, Position(9, 2))
 
@@ -183,7 +190,7 @@ def test_parse_input_file_empty_ships_line():
     assert size == 8
     assert initial_ships == []
     assert len(operations) == 2
-    assert operations[0] == (OperationType.MOVE, Position(0, 0), [MoveCommand.M])
+    assert operations[0] == (OperationType.MOVE, Position(0, 0), bytes([MoveCommand.M]))
     assert operations[1] == (OperationType.SHOOT, Position(1, 1))
 
 
@@ -222,18 +229,36 @@ def test_parse_input_file_empty_lines_ignored():
     assert operations[0] == (
         OperationType.MOVE,
         Position(0, 0),
-        [
-            MoveCommand.M,
-            MoveCommand.R,
-            MoveCommand.M,
-            MoveCommand.L,
-            MoveCommand.M,
-            MoveCommand.M,
-        ],
+        bytes(
+            [
+                MoveCommand.M,
+                MoveCommand.R,
+                MoveCommand.M,
+                MoveCommand.L,
+                MoveCommand.M,
+                MoveCommand.M,
+            ]
+        ),
     )
     assert operations[1] == (OperationType.SHOOT, Position(9, 2))
 
 
+def test_parse_input_file_mixed_case_and_spacing():
+    input_data = "10\n(0, 0, N)\n  (0,0)mRm  \n\t( 1 , 2 )\n(3, 4) l\n"
+    size, initial_ships, operations = parse_input_file(io.StringIO(input_data))
+    assert size == 10
+    assert len(initial_ships) == 1
+    assert operations == [
+        (
+            OperationType.MOVE,
+            Position(0, 0),
+            bytes([MoveCommand.M, MoveCommand.R, MoveCommand.M]),
+        ),
+        (OperationType.SHOOT, Position(1, 2)),
+        (OperationType.MOVE, Position(3, 4), bytes([MoveCommand.L])),
+    ]
+
+
 def test_parse_input_file_error_handling():
     # Error on line 1
     input_data_bad_size = "abc\n(0, 0, N)\n(0, 0) M"
@@ -263,6 +288,33 @@ def test_parse_input_file_error_handling():
         parse_input_file(file)
 
 
+def test_parse_header_then_iter_operations(monkeypatch: pytest.MonkeyPatch):
+    # Tiny read chunks so lines get split across reads
+    monkeypatch.setattr(parser, "_READ_CHUNK_SIZE", 4)
+    file = io.StringIO("10\n(0, 0, N)\n(0, 0) MRM\n\n( 1, 2 )\n(0, 0) MX\n")
+
+    size, initial_ships = parse_header(file)
+    assert size == 10
+    assert initial_ships == [Ship(Position(0, 0), Orientation.N)]
+
+    operations = iter_operations(file)
+    assert next(operations) == (
+        OperationType.MOVE,
+        Position(0, 0),
+        bytes([MoveCommand.M, MoveCommand.R, MoveCommand.M]),
+    )
+    assert next(operations) == (OperationType.SHOOT, Position(1, 2))
+    with pytest.raises(ParseError, match="Error on line 6.*Invalid operation format"):
+        next(operations)
+
+
+def test_parse_input_file_oversized_coordinate():
+    # Beyond the int() digit limit: still a ParseError with its line number
+    file = io.StringIO(f"10\n(0, 0, N)\n(0, 0) M\n({'9' * 5000}, 1)\n")
+    with pytest.raises(ParseError, match="Error on line 4: Invalid coordinate numbers"):
+        parse_input_file(file)
+
+
 def test_parse_input_file_empty_file():
     file = io.StringIO("")
     with pytest.raises(ParseError, match="Input file is empty"):
@@ -278,16 +330,20 @@ def test_parse_input_file_missing_lines():
 
 
 def test_parse_move_sequence_valid():
-    assert parse_move_sequence("LMR") == [MoveCommand.L, MoveCommand.M, MoveCommand.R]
-    assert parse_move_sequence("mrmlmm") == [
-        MoveCommand.M,
-        MoveCommand.R,
-        MoveCommand.M,
-        MoveCommand.L,
-        MoveCommand.M,
-        MoveCommand.M,
-    ]
-    assert parse_move_sequence("") == []
+    assert parse_move_sequence("LMR") == bytes(
+        [MoveCommand.L, MoveCommand.M, MoveCommand.R]
+    )
+    assert parse_move_sequence("mrmlmm") == bytes(
+        [
+            MoveCommand.M,
+            MoveCommand.R,
+            MoveCommand.M,
+            MoveCommand.L,
+            MoveCommand.M,
+            MoveCommand.M,
+        ]
+    )
+    assert parse_move_sequence("") == b""
 
 
 def test_parse_move_sequence_invalid():